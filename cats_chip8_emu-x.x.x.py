@@ -18,9 +18,9 @@ import pygame
 import pygame.freetype
 import sys
 import os
-import random
 import math
 import array
+import functools
 import time
 from typing import List, Tuple, Dict, Callable, Optional
 
@@ -30,6 +30,7 @@ from typing import List, Tuple, Dict, Callable, Optional
 
 CHIP8_WIDTH, CHIP8_HEIGHT = 64, 32
 SCHIP_WIDTH, SCHIP_HEIGHT = 128, 64
+ALL_ROWS = (1 << SCHIP_HEIGHT) - 1  # CPU.dirty mask covering every row
 
 WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 680
@@ -93,6 +94,33 @@ SCHIP_FONT = bytes([
     0x3C,0x7E,0xC3,0xC3,0x7F,0x3F,0x03,0x03,0x3E,0x7C,
 ])
 
+# Sprite byte -> its 8 pixels as one 0/1 byte each, leftmost first
+SPRITE_BITS = [bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256)]
+
+# The same pixels packed big-endian into an int. A whole sprite row can then
+# be tested and XORed against 8 framebuffer bytes with single int operations
+# instead of a per-pixel loop.
+SPRITE_LANES = [int.from_bytes(bits, 'big') for bits in SPRITE_BITS]
+
+# Hex digits for every byte and word, so the debug views index instead of
+# running the format machinery for each cell
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
+_HEX4 = tuple(f"{i:04X}" for i in range(65536))
+
+
+def xor_wrapped(g, o, w, vx, bits, n):
+    """XOR an n-pixel lane row into the w-wide row at g[o], starting at
+    column vx and wrapping past the right edge. Returns the collision bits."""
+    k = w - vx  # pixels that fit before the edge
+    sh = 8 * (n - k)
+    head, tail = bits >> sh, bits & ((1 << sh) - 1)
+    a, e, b = o + vx, o + w, o + n - k
+    old_h = int.from_bytes(g[a:e], 'big')
+    old_t = int.from_bytes(g[o:b], 'big')
+    g[a:e] = (old_h ^ head).to_bytes(k, 'big')
+    g[o:b] = (old_t ^ tail).to_bytes(n - k, 'big')
+    return (old_h & head) | (old_t & tail)
+
 KEY_MAP = {
     pygame.K_1: 0x1, pygame.K_2: 0x2, pygame.K_3: 0x3, pygame.K_4: 0xC,
     pygame.K_q: 0x4, pygame.K_w: 0x5, pygame.K_e: 0x6, pygame.K_r: 0xD,
@@ -118,25 +146,37 @@ class FileBrowser:
         self.result = None
         self.active = False
         self.extensions = ('.ch8', '.c8', '.rom', '.bin')
+        self._text_cache = {}
         self._refresh()
     
+    def _text(self, s, col):
+        """Render s once per (text, color) and reuse the surface."""
+        k = (s, col)
+        r = self._text_cache.get(k)
+        if r is None:
+            r = self._text_cache[k] = self.font.render(s, col)
+        return r
+    
     def _refresh(self):
         """Refresh file list."""
         self.files = []
+        self._text_cache.clear()
         try:
             # Parent directory
             if self.path != '/':
                 self.files.append(('..', True))
             
             items = []
-            for name in os.listdir(self.path):
-                if name.startswith('.'):
-                    continue
-                full = os.path.join(self.path, name)
-                is_dir = os.path.isdir(full)
-                # Show directories and matching files
-                if is_dir or name.lower().endswith(self.extensions):
-                    items.append((name, is_dir))
+            # scandir reuses the type info from the directory read instead
+            # of stat-ing every entry
+            with os.scandir(self.path) as it:
+                for e in it:
+                    if e.name.startswith('.'):
+                        continue
+                    is_dir = e.is_dir()
+                    # Show directories and matching files
+                    if is_dir or e.name.lower().endswith(self.extensions):
+                        items.append((e.name, is_dir))
             
             # Sort: directories first, then files
             items.sort(key=lambda x: (not x[1], x[0].lower()))
@@ -180,14 +220,14 @@ class FileBrowser:
         # Title bar
         pygame.draw.rect(self.screen, BG_LIGHT, (bx, by, bw, 32), border_radius=8)
         pygame.draw.rect(self.screen, BG_LIGHT, (bx, by + 16, bw, 16))
-        ts, _ = self.font.render("Open ROM File", TEXT)
+        ts, _ = self._text("Open ROM File", TEXT)
         self.screen.blit(ts, (bx + 12, by + 8))
         
         # Current path
         path_display = self.path
         if len(path_display) > 55:
             path_display = "..." + path_display[-52:]
-        ts, _ = self.font.render(path_display, TEXT_DIM)
+        ts, _ = self._text(path_display, TEXT_DIM)
         self.screen.blit(ts, (bx + 12, by + 40))
         
         # File list
@@ -217,7 +257,7 @@ class FileBrowser:
             display = icon + name
             if len(display) > 50:
                 display = display[:47] + "..."
-            ts, _ = self.font.render(display, fg)
+            ts, _ = self._text(display, fg)
             self.screen.blit(ts, (bx + 16, iy + 3))
         
         # Scrollbar
@@ -232,17 +272,17 @@ class FileBrowser:
         # Cancel button
         cancel_rect = pygame.Rect(bx + bw - 170, btn_y, 70, 28)
         pygame.draw.rect(self.screen, BG_LIGHT, cancel_rect, border_radius=4)
-        ts, tr = self.font.render("Cancel", TEXT)
+        ts, tr = self._text("Cancel", TEXT)
         self.screen.blit(ts, (cancel_rect.centerx - tr.width//2, cancel_rect.centery - tr.height//2))
         
         # Open button
         open_rect = pygame.Rect(bx + bw - 90, btn_y, 70, 28)
         pygame.draw.rect(self.screen, ACCENT, open_rect, border_radius=4)
-        ts, tr = self.font.render("Open", BG_DARK)
+        ts, tr = self._text("Open", BG_DARK)
         self.screen.blit(ts, (open_rect.centerx - tr.width//2, open_rect.centery - tr.height//2))
         
         # Instructions
-        ts, _ = self.font.render("↑↓:Select  Enter:Open  Esc:Cancel", TEXT_DIM)
+        ts, _ = self._text("↑↓:Select  Enter:Open  Esc:Cancel", TEXT_DIM)
         self.screen.blit(ts, (bx + 12, btn_y + 6))
         
         # Store button rects for click handling
@@ -337,12 +377,22 @@ class MessageBox:
         self.active = False
         self.title = ""
         self.message = ""
+        self._text_cache = {}
+    
+    def _text(self, s, col):
+        """Render s once per (text, color) and reuse the surface."""
+        k = (s, col)
+        r = self._text_cache.get(k)
+        if r is None:
+            r = self._text_cache[k] = self.font.render(s, col)
+        return r
     
     def show(self, title: str, message: str):
         """Show the message box."""
         self.title = title
         self.message = message
         self.active = True
+        self._text_cache.clear()
     
     def draw(self):
         """Draw the message box."""
@@ -369,20 +419,20 @@ class MessageBox:
         # Title
         pygame.draw.rect(self.screen, BG_LIGHT, (bx, by, bw, 30), border_radius=8)
         pygame.draw.rect(self.screen, BG_LIGHT, (bx, by + 15, bw, 15))
-        ts, _ = self.font.render(self.title, TEXT)
+        ts, _ = self._text(self.title, TEXT)
         self.screen.blit(ts, (bx + 12, by + 7))
         
         # Message
         y = by + 45
         for line in lines:
-            ts, _ = self.font.render(line, TEXT)
+            ts, _ = self._text(line, TEXT)
             self.screen.blit(ts, (bx + 15, y))
             y += 18
         
         # OK button
         btn_rect = pygame.Rect(bx + bw//2 - 40, by + bh - 40, 80, 28)
         pygame.draw.rect(self.screen, ACCENT, btn_rect, border_radius=4)
-        ts, tr = self.font.render("OK", BG_DARK)
+        ts, tr = self._text("OK", BG_DARK)
         self.screen.blit(ts, (btn_rect.centerx - tr.width//2, btn_rect.centery - tr.height//2))
         
         self._btn_rect = btn_rect
@@ -414,13 +464,16 @@ class Sound:
         self.playing = False
         try:
             n = 4410
-            samples = []
-            for i in range(n):
-                t = i / 44100
-                env = min(1.0, i/80) * min(1.0, (n-i)/80)
-                val = int(16000 * env * math.sin(2 * math.pi * 440 * t))
-                samples.extend([val, val])
-            self.sound = pygame.mixer.Sound(buffer=array.array('h', samples))
+            w = 2 * math.pi * 440 / 44100
+            mono = array.array('h', [
+                int(16000 * min(1.0, i/80) * min(1.0, (n-i)/80) * math.sin(w * i))
+                for i in range(n)
+            ])
+            # Interleave into both stereo channels with strided slice stores
+            samples = array.array('h', bytes(4 * n))
+            samples[0::2] = mono
+            samples[1::2] = mono
+            self.sound = pygame.mixer.Sound(buffer=samples)
             self.sound.set_volume(0.2)
         except:
             pass
@@ -440,31 +493,79 @@ class Sound:
 # CHIP-8 CPU
 # ============================================================================
 
+@functools.lru_cache(maxsize=65536)
+def _disasm_word(op: int) -> str:
+    """Mnemonic for one instruction word; pure, so cached per opcode."""
+    nnn, nn, n = op & 0xFFF, op & 0xFF, op & 0xF
+    x, y, hi = (op >> 8) & 0xF, (op >> 4) & 0xF, (op >> 12) & 0xF
+    if op == 0x00E0: return "CLS"
+    if op == 0x00EE: return "RET"
+    if hi == 1: return f"JP {nnn:03X}"
+    if hi == 2: return f"CALL {nnn:03X}"
+    if hi == 3: return f"SE V{x:X},{nn:02X}"
+    if hi == 4: return f"SNE V{x:X},{nn:02X}"
+    if hi == 6: return f"LD V{x:X},{nn:02X}"
+    if hi == 7: return f"ADD V{x:X},{nn:02X}"
+    if hi == 8:
+        ops = {0:'LD',1:'OR',2:'AND',3:'XOR',4:'ADD',5:'SUB',6:'SHR',7:'SUBN',0xE:'SHL'}
+        return f"{ops.get(n,'?')} V{x:X},V{y:X}"
+    if hi == 0xA: return f"LD I,{nnn:03X}"
+    if hi == 0xC: return f"RND V{x:X},{nn:02X}"
+    if hi == 0xD: return f"DRW V{x:X},V{y:X},{n}"
+    return f"{op:04X}"
+
+
 class CPU:
     def __init__(self):
+        # Opcode word -> (handler, operands), filled in lazily by _decode.
+        # The mapping only depends on the word itself, so it is shared
+        # across resets and never needs invalidating.
+        self._decoded = [None] * 0x10000
+        self._sys_ops = {
+            0x00E0: self._00e0, 0x00EE: self._00ee, 0x00FB: self._00fb,
+            0x00FC: self._00fc, 0x00FD: self._00fd, 0x00FE: self._00fe,
+            0x00FF: self._00ff,
+        }
+        self._alu_ops = {
+            0x0: self._8xy0, 0x1: self._8xy1, 0x2: self._8xy2,
+            0x3: self._8xy3, 0x4: self._8xy4, 0x5: self._8xy5,
+            0x6: self._8xy6, 0x7: self._8xy7, 0xE: self._8xye,
+        }
+        self._key_ops = {0x9E: self._ex9e, 0xA1: self._exa1}
+        self._misc_ops = {
+            0x07: self._fx07, 0x0A: self._fx0a, 0x15: self._fx15,
+            0x18: self._fx18, 0x1E: self._fx1e, 0x29: self._fx29,
+            0x30: self._fx30, 0x33: self._fx33, 0x55: self._fx55,
+            0x65: self._fx65, 0x75: self._fx75, 0x85: self._fx85,
+        }
         self.reset()
 
     def reset(self):
         self.mem = bytearray(MEMORY_SIZE)
-        self.V = [0] * 16
+        self.V = array.array('B', [0] * 16)
         self.I = 0
         self.PC = PROGRAM_START
-        self.stack = [0] * 16
+        self.stack = array.array('H', [0] * 16)
         self.SP = 0
         self.DT = self.ST = 0
         self.hires = False
-        self.gfx = [[0]*CHIP8_WIDTH for _ in range(CHIP8_HEIGHT)]
-        self.gfx_hi = [[0]*SCHIP_WIDTH for _ in range(SCHIP_HEIGHT)]
-        self.keys = [0] * 16
+        # Flat row-major framebuffers, one byte per pixel: g[y*w + x]
+        self.gfx = bytearray(CHIP8_WIDTH * CHIP8_HEIGHT)
+        self.gfx_hi = bytearray(SCHIP_WIDTH * SCHIP_HEIGHT)
+        self.keys_mask = 0  # bit k set while key k is held
         self.wait_key = False
         self.wait_reg = 0
         self.draw_flag = True
+        self.dirty = ALL_ROWS  # bit y set when framebuffer row y changed
         self.halted = False
         self.loaded = False
         self.rom_name = ""
         self.rom_path = ""
         self.cycles = 0
-        self.rpl = [0] * 8
+        self.rpl = array.array('B', [0] * 8)
+        # Cxnn draws from a block of OS randomness, refilled when used up
+        self._rand_pool = os.urandom(4096)
+        self._rand_idx = 0
         self.mem[0:len(FONTSET)] = FONTSET
         self.mem[80:80+len(SCHIP_FONT)] = SCHIP_FONT
 
@@ -492,207 +593,347 @@ class CPU:
         self.rom_name = name
         return True
 
-    def display(self):
+    def display(self) -> bytearray:
+        """Active framebuffer, row-major with a stride of size()[0]."""
         return self.gfx_hi if self.hires else self.gfx
 
     def size(self):
         return (SCHIP_WIDTH, SCHIP_HEIGHT) if self.hires else (CHIP8_WIDTH, CHIP8_HEIGHT)
 
     def step(self):
-        if self.halted or self.wait_key:
-            return
-        op = (self.mem[self.PC] << 8) | self.mem[self.PC + 1]
-        self._exec(op)
-        self.cycles += 1
-
-    def _exec(self, op):
-        nnn, nn, n = op & 0xFFF, op & 0xFF, op & 0xF
-        x, y, hi = (op >> 8) & 0xF, (op >> 4) & 0xF, (op >> 12) & 0xF
-
-        if op == 0x00E0:
-            g = self.gfx_hi if self.hires else self.gfx
-            for r in g:
-                for i in range(len(r)): r[i] = 0
-            self.draw_flag = True
-            self.PC += 2
-        elif op == 0x00EE:
-            self.SP -= 1
-            self.PC = self.stack[self.SP] + 2
-        elif op == 0x00FB:
-            self._scroll_r()
-            self.PC += 2
-        elif op == 0x00FC:
-            self._scroll_l()
-            self.PC += 2
-        elif op == 0x00FD:
-            self.halted = True
-        elif op == 0x00FE:
-            self.hires = False
-            self.PC += 2
-        elif op == 0x00FF:
-            self.hires = True
-            self.PC += 2
-        elif hi == 0 and (op & 0xF0) == 0xC0:
-            self._scroll_d(n)
-            self.PC += 2
-        elif hi == 0:
-            self.PC += 2
-        elif hi == 1:
-            self.PC = nnn
-        elif hi == 2:
-            self.stack[self.SP] = self.PC
-            self.SP += 1
-            self.PC = nnn
-        elif hi == 3:
-            self.PC += 4 if self.V[x] == nn else 2
-        elif hi == 4:
-            self.PC += 4 if self.V[x] != nn else 2
-        elif hi == 5 and n == 0:
-            self.PC += 4 if self.V[x] == self.V[y] else 2
-        elif hi == 6:
-            self.V[x] = nn
-            self.PC += 2
-        elif hi == 7:
-            self.V[x] = (self.V[x] + nn) & 0xFF
-            self.PC += 2
-        elif hi == 8:
-            self._alu(x, y, n)
-            self.PC += 2
-        elif hi == 9 and n == 0:
-            self.PC += 4 if self.V[x] != self.V[y] else 2
-        elif hi == 0xA:
-            self.I = nnn
-            self.PC += 2
-        elif hi == 0xB:
-            self.PC = nnn + self.V[0]
-        elif hi == 0xC:
-            self.V[x] = random.randint(0, 255) & nn
-            self.PC += 2
-        elif hi == 0xD:
-            self._draw(x, y, n)
-            self.PC += 2
-        elif hi == 0xE:
-            k = self.V[x] & 0xF
-            if nn == 0x9E:
-                self.PC += 4 if self.keys[k] else 2
-            elif nn == 0xA1:
-                self.PC += 4 if not self.keys[k] else 2
-            else:
-                self.PC += 2
-        elif hi == 0xF:
-            self._misc(x, nn)
+        self.run(1)
+
+    def run(self, n: int):
+        """Execute up to n cycles, stopping early on halt or key wait."""
+        mem, decoded, decode = self.mem, self._decoded, self._decode
+        done = 0
+        while done < n and not (self.halted or self.wait_key):
+            pc = self.PC
+            op = (mem[pc] << 8) | mem[pc + 1]
+            h, args = decoded[op] or decode(op)
+            h(*args)
+            done += 1
+        self.cycles += done
+
+    def _decode(self, op):
+        hi, x, y = op >> 12, (op >> 8) & 0xF, (op >> 4) & 0xF
+        n, nn, nnn = op & 0xF, op & 0xFF, op & 0xFFF
+        if hi == 0:
+            h = self._sys_ops.get(op)
+            if h: d = (h, ())
+            elif (op & 0xF0) == 0xC0: d = (self._00cn, (n,))
+            else: d = (self._nop, ())
+        elif hi == 1: d = (self._op1, (nnn,))
+        elif hi == 2: d = (self._op2, (nnn,))
+        elif hi == 3: d = (self._op3, (x, nn))
+        elif hi == 4: d = (self._op4, (x, nn))
+        elif hi == 5: d = (self._op5, (x, y)) if n == 0 else (self._nop, ())
+        elif hi == 6: d = (self._op6, (x, nn))
+        elif hi == 7: d = (self._op7, (x, nn))
+        elif hi == 8: d = (self._alu_ops.get(n, self._nop), (x, y))
+        elif hi == 9: d = (self._op9, (x, y)) if n == 0 else (self._nop, ())
+        elif hi == 0xA: d = (self._opA, (nnn,))
+        elif hi == 0xB: d = (self._opB, (nnn,))
+        elif hi == 0xC: d = (self._opC, (x, nn))
+        elif hi == 0xD: d = (self._opD, (x, y, n))
+        elif hi == 0xE: d = (self._key_ops.get(nn, self._nop), (x,))
+        else: d = (self._misc_ops.get(nn, self._nop), (x,))
+        self._decoded[op] = d
+        return d
+
+    def _nop(self, *_):
+        self.PC += 2
+
+    def _00e0(self):
+        g = self.gfx_hi if self.hires else self.gfx
+        g[:] = bytes(len(g))
+        self.draw_flag = True
+        self.dirty = ALL_ROWS
+        self.PC += 2
+
+    def _00ee(self):
+        self.SP -= 1
+        self.PC = self.stack[self.SP] + 2
+
+    def _00cn(self, n):
+        self._scroll_d(n)
+        self.PC += 2
+
+    def _00fb(self):
+        self._scroll_r()
+        self.PC += 2
+
+    def _00fc(self):
+        self._scroll_l()
+        self.PC += 2
+
+    def _00fd(self):
+        self.halted = True
+
+    def _00fe(self):
+        self.hires = False
+        self.dirty = ALL_ROWS
+        self.PC += 2
+
+    def _00ff(self):
+        self.hires = True
+        self.dirty = ALL_ROWS
+        self.PC += 2
+
+    def _op1(self, nnn):
+        self.PC = nnn
+
+    def _op2(self, nnn):
+        self.stack[self.SP] = self.PC
+        self.SP += 1
+        self.PC = nnn
+
+    def _op3(self, x, nn):
+        self.PC += 4 if self.V[x] == nn else 2
+
+    def _op4(self, x, nn):
+        self.PC += 4 if self.V[x] != nn else 2
+
+    def _op5(self, x, y):
+        self.PC += 4 if self.V[x] == self.V[y] else 2
+
+    def _op6(self, x, nn):
+        self.V[x] = nn
+        self.PC += 2
+
+    def _op7(self, x, nn):
+        self.V[x] = (self.V[x] + nn) & 0xFF
+        self.PC += 2
+
+    def _op9(self, x, y):
+        self.PC += 4 if self.V[x] != self.V[y] else 2
+
+    def _opA(self, nnn):
+        self.I = nnn
+        self.PC += 2
+
+    def _opB(self, nnn):
+        self.PC = nnn + self.V[0]
+
+    def _opC(self, x, nn):
+        i = self._rand_idx
+        self.V[x] = self._rand_pool[i] & nn
+        i = (i + 1) & 0xFFF
+        if not i:
+            self._rand_pool = os.urandom(4096)
+        self._rand_idx = i
+        self.PC += 2
+
+    def _opD(self, x, y, n):
+        self._draw(x, y, n)
+        self.PC += 2
+
+    def _8xy0(self, x, y):
+        self.V[x] = self.V[y]
+        self.PC += 2
+
+    def _8xy1(self, x, y):
+        V = self.V
+        V[x] |= V[y]
+        V[0xF] = 0
+        self.PC += 2
+
+    def _8xy2(self, x, y):
+        V = self.V
+        V[x] &= V[y]
+        V[0xF] = 0
+        self.PC += 2
+
+    def _8xy3(self, x, y):
+        V = self.V
+        V[x] ^= V[y]
+        V[0xF] = 0
+        self.PC += 2
+
+    def _8xy4(self, x, y):
+        V = self.V
+        r = V[x] + V[y]
+        V[x] = r & 0xFF
+        V[0xF] = r >> 8
+        self.PC += 2
+
+    def _8xy5(self, x, y):
+        V = self.V
+        vx, vy = V[x], V[y]
+        V[x] = (vx - vy) & 0xFF
+        V[0xF] = 1 if vx >= vy else 0
+        self.PC += 2
+
+    def _8xy6(self, x, y):
+        V = self.V
+        f = V[x] & 1
+        V[x] >>= 1
+        V[0xF] = f
+        self.PC += 2
+
+    def _8xy7(self, x, y):
+        V = self.V
+        vx, vy = V[x], V[y]
+        V[x] = (vy - vx) & 0xFF
+        V[0xF] = 1 if vy >= vx else 0
+        self.PC += 2
+
+    def _8xye(self, x, y):
+        V = self.V
+        vx = V[x]
+        V[x] = (vx << 1) & 0xFF
+        V[0xF] = vx >> 7
+        self.PC += 2
+
+    def _ex9e(self, x):
+        self.PC += 4 if (self.keys_mask >> (self.V[x] & 0xF)) & 1 else 2
+
+    def _exa1(self, x):
+        self.PC += 2 if (self.keys_mask >> (self.V[x] & 0xF)) & 1 else 4
+
+    def _fx07(self, x):
+        self.V[x] = self.DT
+        self.PC += 2
+
+    def _fx0a(self, x):
+        # PC advances in key_down once a key arrives
+        self.wait_key = True
+        self.wait_reg = x
+
+    def _fx15(self, x):
+        self.DT = self.V[x]
+        self.PC += 2
+
+    def _fx18(self, x):
+        self.ST = self.V[x]
+        self.PC += 2
+
+    def _fx1e(self, x):
+        self.I = (self.I + self.V[x]) & 0xFFFF
+        self.PC += 2
+
+    def _fx29(self, x):
+        self.I = (self.V[x] & 0xF) * 5
+        self.PC += 2
+
+    def _fx30(self, x):
+        self.I = 80 + (self.V[x] & 0xF) * 10
+        self.PC += 2
+
+    def _fx33(self, x):
+        v = self.V[x]
+        self.mem[self.I] = v // 100
+        self.mem[self.I+1] = (v // 10) % 10
+        self.mem[self.I+2] = v % 10
+        self.PC += 2
+
+    def _fx55(self, x):
+        I = self.I
+        if I + x < MEMORY_SIZE:
+            self.mem[I:I+x+1] = self.V[:x+1]
         else:
-            self.PC += 2
-
-    def _alu(self, x, y, n):
-        if n == 0: self.V[x] = self.V[y]
-        elif n == 1: self.V[x] |= self.V[y]; self.V[0xF] = 0
-        elif n == 2: self.V[x] &= self.V[y]; self.V[0xF] = 0
-        elif n == 3: self.V[x] ^= self.V[y]; self.V[0xF] = 0
-        elif n == 4:
-            r = self.V[x] + self.V[y]
-            self.V[x] = r & 0xFF
-            self.V[0xF] = 1 if r > 255 else 0
-        elif n == 5:
-            f = 1 if self.V[x] >= self.V[y] else 0
-            self.V[x] = (self.V[x] - self.V[y]) & 0xFF
-            self.V[0xF] = f
-        elif n == 6:
-            f = self.V[x] & 1
-            self.V[x] >>= 1
-            self.V[0xF] = f
-        elif n == 7:
-            f = 1 if self.V[y] >= self.V[x] else 0
-            self.V[x] = (self.V[y] - self.V[x]) & 0xFF
-            self.V[0xF] = f
-        elif n == 0xE:
-            f = (self.V[x] >> 7) & 1
-            self.V[x] = (self.V[x] << 1) & 0xFF
-            self.V[0xF] = f
-
-    def _misc(self, x, nn):
-        if nn == 0x07: self.V[x] = self.DT
-        elif nn == 0x0A:
-            self.wait_key = True
-            self.wait_reg = x
-            return
-        elif nn == 0x15: self.DT = self.V[x]
-        elif nn == 0x18: self.ST = self.V[x]
-        elif nn == 0x1E: self.I = (self.I + self.V[x]) & 0xFFFF
-        elif nn == 0x29: self.I = (self.V[x] & 0xF) * 5
-        elif nn == 0x30: self.I = 80 + (self.V[x] & 0xF) * 10
-        elif nn == 0x33:
-            v = self.V[x]
-            self.mem[self.I] = v // 100
-            self.mem[self.I+1] = (v // 10) % 10
-            self.mem[self.I+2] = v % 10
-        elif nn == 0x55:
-            for i in range(x+1): self.mem[(self.I+i) & 0xFFF] = self.V[i]
-        elif nn == 0x65:
-            for i in range(x+1): self.V[i] = self.mem[(self.I+i) & 0xFFF]
-        elif nn == 0x75:
-            for i in range(min(x+1, 8)): self.rpl[i] = self.V[i]
-        elif nn == 0x85:
-            for i in range(min(x+1, 8)): self.V[i] = self.rpl[i]
+            for i in range(x+1): self.mem[(I+i) & 0xFFF] = self.V[i]
+        self.PC += 2
+
+    def _fx65(self, x):
+        I = self.I
+        if I + x < MEMORY_SIZE:
+            self.V[:x+1] = array.array('B', self.mem[I:I+x+1])
+        else:
+            for i in range(x+1): self.V[i] = self.mem[(I+i) & 0xFFF]
+        self.PC += 2
+
+    def _fx75(self, x):
+        for i in range(min(x+1, 8)): self.rpl[i] = self.V[i]
+        self.PC += 2
+
+    def _fx85(self, x):
+        for i in range(min(x+1, 8)): self.V[i] = self.rpl[i]
         self.PC += 2
 
     def _draw(self, x, y, n):
-        vx, vy = self.V[x], self.V[y]
-        g = self.gfx_hi if self.hires else self.gfx
-        w, h = self.size()
+        V = self.V
+        vx, vy = V[x], V[y]
         if n == 0 and self.hires:
             self._draw16(vx, vy)
             return
+        g = self.gfx_hi if self.hires else self.gfx
+        w, h = self.size()
+        mem, I, lanes = self.mem, self.I, SPRITE_LANES
         vx %= w
         vy %= h
-        self.V[0xF] = 0
+        vf = rows = 0
         for row in range(n):
             py = (vy + row) % h
-            spr = self.mem[(self.I + row) & 0xFFF]
-            for col in range(8):
-                px = (vx + col) % w
-                if (spr >> (7 - col)) & 1:
-                    if g[py][px]: self.V[0xF] = 1
-                    g[py][px] ^= 1
+            spr = mem[(I + row) & 0xFFF]
+            if not spr:
+                continue
+            rows |= 1 << py
+            if vx + 8 <= w:
+                # Whole row fits: XOR all 8 pixels at once
+                o = py * w + vx
+                bits = lanes[spr]
+                old = int.from_bytes(g[o:o+8], 'big')
+                if old & bits: vf = 1
+                g[o:o+8] = (old ^ bits).to_bytes(8, 'big')
+                continue
+            if xor_wrapped(g, py * w, w, vx, lanes[spr], 8): vf = 1
+        V[0xF] = vf
+        self.dirty |= rows
         self.draw_flag = True
 
     def _draw16(self, vx, vy):
         g = self.gfx_hi
+        mem, I, lanes = self.mem, self.I, SPRITE_LANES
         vx %= SCHIP_WIDTH
         vy %= SCHIP_HEIGHT
-        self.V[0xF] = 0
+        vf = rows = 0
         for row in range(16):
             py = (vy + row) % SCHIP_HEIGHT
-            word = (self.mem[(self.I + row*2) & 0xFFF] << 8) | self.mem[(self.I + row*2 + 1) & 0xFFF]
-            for col in range(16):
-                px = (vx + col) % SCHIP_WIDTH
-                if (word >> (15 - col)) & 1:
-                    if g[py][px]: self.V[0xF] = 1
-                    g[py][px] ^= 1
+            a = I + row*2
+            word = (mem[a & 0xFFF] << 8) | mem[(a + 1) & 0xFFF]
+            if not word:
+                continue
+            rows |= 1 << py
+            if vx + 16 <= SCHIP_WIDTH:
+                # Two 8-pixel lanes side by side cover the 16-pixel row
+                o = py * SCHIP_WIDTH + vx
+                bits = (lanes[word >> 8] << 64) | lanes[word & 0xFF]
+                old = int.from_bytes(g[o:o+16], 'big')
+                if old & bits: vf = 1
+                g[o:o+16] = (old ^ bits).to_bytes(16, 'big')
+                continue
+            bits = (lanes[word >> 8] << 64) | lanes[word & 0xFF]
+            if xor_wrapped(g, py * SCHIP_WIDTH, SCHIP_WIDTH, vx, bits, 16): vf = 1
+        self.V[0xF] = vf
+        self.dirty |= rows
         self.draw_flag = True
 
     def _scroll_d(self, n):
         g = self.gfx_hi if self.hires else self.gfx
-        h, w = len(g), len(g[0])
-        for y in range(h-1, n-1, -1): g[y] = g[y-n][:]
-        for y in range(n): g[y] = [0]*w
+        k = n * self.size()[0]
+        g[k:] = g[:len(g)-k]
+        g[:k] = bytes(k)
         self.draw_flag = True
+        self.dirty = ALL_ROWS
 
     def _scroll_r(self):
         g = self.gfx_hi if self.hires else self.gfx
-        w = len(g[0])
-        for row in g:
-            for x in range(w-1, 3, -1): row[x] = row[x-4]
-            for x in range(4): row[x] = 0
+        w = self.size()[0]
+        # Shift the whole buffer, then blank the 4 pixels that spilled
+        # over from the end of the previous row
+        g[4:] = g[:-4]
+        for o in range(0, len(g), w): g[o:o+4] = bytes(4)
         self.draw_flag = True
+        self.dirty = ALL_ROWS
 
     def _scroll_l(self):
         g = self.gfx_hi if self.hires else self.gfx
-        w = len(g[0])
-        for row in g:
-            for x in range(w-4): row[x] = row[x+4]
-            for x in range(w-4, w): row[x] = 0
+        w = self.size()[0]
+        g[:-4] = g[4:]
+        for o in range(w-4, len(g), w): g[o:o+4] = bytes(4)
         self.draw_flag = True
+        self.dirty = ALL_ROWS
 
     def tick_timers(self):
         if self.DT > 0: self.DT -= 1
@@ -700,7 +941,7 @@ class CPU:
 
     def key_down(self, k):
         if 0 <= k < 16:
-            self.keys[k] = 1
+            self.keys_mask |= 1 << k
             if self.wait_key:
                 self.V[self.wait_reg] = k
                 self.wait_key = False
@@ -708,60 +949,63 @@ class CPU:
 
     def key_up(self, k):
         if 0 <= k < 16:
-            self.keys[k] = 0
+            self.keys_mask &= ~(1 << k)
 
     def state(self) -> dict:
         return {
-            'mem': bytes(self.mem), 'V': self.V[:], 'I': self.I, 'PC': self.PC,
-            'stack': self.stack[:], 'SP': self.SP, 'DT': self.DT, 'ST': self.ST,
-            'hires': self.hires, 'gfx': [r[:] for r in self.gfx],
-            'gfx_hi': [r[:] for r in self.gfx_hi], 'cycles': self.cycles,
+            'mem': bytes(self.mem), 'V': bytes(self.V), 'I': self.I, 'PC': self.PC,
+            'stack': self.stack.tobytes(), 'SP': self.SP, 'DT': self.DT, 'ST': self.ST,
+            'hires': self.hires, 'gfx': bytes(self.gfx),
+            'gfx_hi': bytes(self.gfx_hi), 'cycles': self.cycles,
         }
 
     def restore(self, s):
         self.mem = bytearray(s['mem'])
-        self.V = s['V'][:]
+        self.V = array.array('B', s['V'])
         self.I, self.PC = s['I'], s['PC']
-        self.stack, self.SP = s['stack'][:], s['SP']
+        self.stack, self.SP = array.array('H', s['stack']), s['SP']
         self.DT, self.ST = s['DT'], s['ST']
         self.hires = s['hires']
-        self.gfx = [r[:] for r in s['gfx']]
-        self.gfx_hi = [r[:] for r in s['gfx_hi']]
+        self.gfx = bytearray(s['gfx'])
+        self.gfx_hi = bytearray(s['gfx_hi'])
         self.cycles = s.get('cycles', 0)
         self.draw_flag = True
+        self.dirty = ALL_ROWS
 
     def disasm(self, addr: int) -> str:
         if addr >= MEMORY_SIZE - 1: return "???"
-        op = (self.mem[addr] << 8) | self.mem[addr + 1]
-        nnn, nn, n = op & 0xFFF, op & 0xFF, op & 0xF
-        x, y, hi = (op >> 8) & 0xF, (op >> 4) & 0xF, (op >> 12) & 0xF
-        if op == 0x00E0: return "CLS"
-        if op == 0x00EE: return "RET"
-        if hi == 1: return f"JP {nnn:03X}"
-        if hi == 2: return f"CALL {nnn:03X}"
-        if hi == 3: return f"SE V{x:X},{nn:02X}"
-        if hi == 4: return f"SNE V{x:X},{nn:02X}"
-        if hi == 6: return f"LD V{x:X},{nn:02X}"
-        if hi == 7: return f"ADD V{x:X},{nn:02X}"
-        if hi == 8:
-            ops = {0:'LD',1:'OR',2:'AND',3:'XOR',4:'ADD',5:'SUB',6:'SHR',7:'SUBN',0xE:'SHL'}
-            return f"{ops.get(n,'?')} V{x:X},V{y:X}"
-        if hi == 0xA: return f"LD I,{nnn:03X}"
-        if hi == 0xC: return f"RND V{x:X},{nn:02X}"
-        if hi == 0xD: return f"DRW V{x:X},V{y:X},{n}"
-        return f"{op:04X}"
-
+        return _disasm_word((self.mem[addr] << 8) | self.mem[addr + 1])
 
 # ============================================================================
 # GUI
 # ============================================================================
 
+# pygame-ce's fblits takes the whole batch without building result rects;
+# plain pygame only has blits, which does the same when doreturn is off
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
+def blit_all(surf, blits):
+    """Blit a list of (surface, dest) pairs in a single call."""
+    if _HAS_FBLITS:
+        surf.fblits(blits)
+    else:
+        surf.blits(blits, False)
+
+
 class MenuSystem:
     """Fixed dropdown menu system."""
     
+    ITEM_H = 28
+    PAD = 4
+    DROP_W = 200
+    
     def __init__(self, font):
         self.font = font
-        self.menus: List[Tuple[str, pygame.Rect, List[Tuple[str, Callable, str]]]] = []
+        # Items carry their hit rect; boxes holds each dropdown's shadowed
+        # background, pre-rendered. Layout is fixed, so built in add()
+        self.menus: List[Tuple[str, pygame.Rect, List[Tuple[str, Callable, str, pygame.Rect]]]] = []
+        self.boxes: List[pygame.Surface] = []
         self.active = -1
         self.hover_item = -1
         
@@ -769,52 +1013,61 @@ class MenuSystem:
         x = 8 + sum(m[1].width + 8 for m in self.menus)
         ts, tr = self.font.render(title, TEXT)
         rect = pygame.Rect(x, 0, tr.width + 16, MENUBAR_H)
-        self.menus.append((title, rect, items))
+        item_h, pad, w = self.ITEM_H, self.PAD, self.DROP_W
+        laid = [(text, cb, shortcut,
+                 pygame.Rect(x + pad, MENUBAR_H + pad + i * item_h, w - pad*2, item_h))
+                for i, (text, cb, shortcut) in enumerate(items)]
+        h = len(items) * item_h + pad * 2
+        self.menus.append((title, rect, laid))
+        box = pygame.Surface((w + 3, h + 3), pygame.SRCALPHA)
+        pygame.draw.rect(box, (0, 0, 0), (3, 3, w, h), border_radius=4)
+        pygame.draw.rect(box, BG_MED, (0, 0, w, h), border_radius=4)
+        pygame.draw.rect(box, BORDER, (0, 0, w, h), 1, border_radius=4)
+        self.boxes.append(box)
     
-    def draw(self, surf):
-        # Menu bar background
+    def draw(self, surf, mouse):
+        self.draw_static(surf)
+        self.draw_overlay(surf, mouse)
+    
+    def draw_static(self, surf):
+        """Bar background and titles, independent of mouse and open menu."""
+        blits = []
         pygame.draw.rect(surf, BG_MED, (0, 0, WINDOW_WIDTH, MENUBAR_H))
         pygame.draw.line(surf, BORDER, (0, MENUBAR_H-1), (WINDOW_WIDTH, MENUBAR_H-1))
-        
-        mouse = pygame.mouse.get_pos()
-        
+        for title, rect, items in self.menus:
+            ts, _ = self.font.render(title, TEXT)
+            blits.append((ts, (rect.x + 8, 5)))
+        blit_all(surf, blits)
+    
+    def draw_overlay(self, surf, mouse):
+        """Hover/active title highlight and the open dropdown."""
         for i, (title, rect, items) in enumerate(self.menus):
             # Highlight on hover or active
             is_hover = rect.collidepoint(mouse) and mouse[1] < MENUBAR_H
             is_active = i == self.active
+            if not (is_active or is_hover):
+                continue
             
-            if is_active:
-                pygame.draw.rect(surf, BG_ACTIVE, rect)
-            elif is_hover:
-                pygame.draw.rect(surf, BG_HOVER, rect)
-            
+            pygame.draw.rect(surf, BG_ACTIVE if is_active else BG_HOVER, rect)
             ts, _ = self.font.render(title, TEXT)
             surf.blit(ts, (rect.x + 8, 5))
             
             # Draw dropdown
             if is_active:
-                self._draw_dropdown(surf, rect.x, items, mouse)
+                self._draw_dropdown(surf, i, rect.x, items, mouse)
     
-    def _draw_dropdown(self, surf, x: int, items, mouse):
-        item_h = 28
-        pad = 4
-        w = 200
-        h = len(items) * item_h + pad * 2
-        
-        # Shadow
-        shadow = pygame.Rect(x + 3, MENUBAR_H + 3, w, h)
-        pygame.draw.rect(surf, (0, 0, 0), shadow, border_radius=4)
+    def _draw_dropdown(self, surf, menu: int, x: int, items, mouse):
+        blits = []
+        item_h = self.ITEM_H
+        w = self.DROP_W
         
-        # Background
-        dropdown = pygame.Rect(x, MENUBAR_H, w, h)
-        pygame.draw.rect(surf, BG_MED, dropdown, border_radius=4)
-        pygame.draw.rect(surf, BORDER, dropdown, 1, border_radius=4)
+        # Shadow and background
+        surf.blit(self.boxes[menu], (x, MENUBAR_H))
         
         self.hover_item = -1
         
-        for i, (text, cb, shortcut) in enumerate(items):
-            iy = MENUBAR_H + pad + i * item_h
-            item_rect = pygame.Rect(x + pad, iy, w - pad*2, item_h)
+        for i, (text, cb, shortcut, item_rect) in enumerate(items):
+            iy = item_rect.y
             
             if text == "-":
                 # Separator
@@ -833,33 +1086,28 @@ class MenuSystem:
             
             # Text
             ts, _ = self.font.render(text, fg)
-            surf.blit(ts, (x + 14, iy + 6))
+            blits.append((ts, (x + 14, iy + 6)))
             
             # Shortcut
             if shortcut:
                 ss, sr = self.font.render(shortcut, fg2)
-                surf.blit(ss, (x + w - sr.width - 14, iy + 6))
+                blits.append((ss, (x + w - sr.width - 14, iy + 6)))
+        blit_all(surf, blits)
     
     def handle(self, ev) -> bool:
         if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
             # Click on menu title?
-            for i, (_, rect, _) in enumerate(self.menus):
-                if rect.collidepoint(ev.pos):
-                    self.active = i if self.active != i else -1
-                    return True
+            if ev.pos[1] < MENUBAR_H:
+                for i, (_, rect, _) in enumerate(self.menus):
+                    if rect.collidepoint(ev.pos):
+                        self.active = i if self.active != i else -1
+                        return True
             
             # Click on dropdown item?
             if self.active >= 0:
-                _, rect, items = self.menus[self.active]
-                x = rect.x
-                item_h = 28
-                pad = 4
-                
-                for i, (text, cb, _) in enumerate(items):
+                for text, cb, _, item_rect in self.menus[self.active][2]:
                     if text == "-":
                         continue
-                    iy = MENUBAR_H + pad + i * item_h
-                    item_rect = pygame.Rect(x + pad, iy, 200 - pad*2, item_h)
                     if item_rect.collidepoint(ev.pos):
                         self.active = -1
                         if cb:
@@ -872,9 +1120,9 @@ class MenuSystem:
         
         elif ev.type == pygame.MOUSEMOTION:
             # Switch menus on hover when one is open
-            if self.active >= 0:
+            if self.active >= 0 and ev.pos[1] < MENUBAR_H:
                 for i, (_, rect, _) in enumerate(self.menus):
-                    if rect.collidepoint(ev.pos) and ev.pos[1] < MENUBAR_H:
+                    if rect.collidepoint(ev.pos):
                         self.active = i
                         return True
         
@@ -888,38 +1136,54 @@ class Toolbar:
     def __init__(self, font):
         self.font = font
         self.buttons: List[Tuple[str, pygame.Rect, Callable, bool]] = []
+        # Pre-rendered (normal, hover) faces, parallel to buttons
+        self.faces: List[Tuple[pygame.Surface, pygame.Surface]] = []
         self.x = 8
     
     def add(self, text: str, cb: Callable, w: int = 60):
         rect = pygame.Rect(self.x, MENUBAR_H + 4, w, 32)
         self.buttons.append((text, rect, cb, True))
+        self.faces.append((self._face(text, rect, True, BG_LIGHT),
+                           self._face(text, rect, True, BG_HOVER)))
         self.x += w + 6
     
     def sep(self):
         self.x += 10
     
-    def draw(self, surf):
+    def draw(self, surf, mouse):
+        self.draw_static(surf)
+        self.draw_overlay(surf, mouse)
+    
+    def draw_static(self, surf):
+        """Bar background and every button in its normal state."""
+        blits = []
         pygame.draw.rect(surf, BG_MED, (0, MENUBAR_H, WINDOW_WIDTH, TOOLBAR_H))
         pygame.draw.line(surf, BORDER, (0, MENUBAR_H + TOOLBAR_H - 1), (WINDOW_WIDTH, MENUBAR_H + TOOLBAR_H - 1))
-        
-        mouse = pygame.mouse.get_pos()
-        
-        for text, rect, cb, enabled in self.buttons:
-            hover = rect.collidepoint(mouse)
-            
-            if hover and enabled:
-                bg = BG_HOVER
-            else:
-                bg = BG_LIGHT
-            
-            pygame.draw.rect(surf, bg, rect, border_radius=4)
-            pygame.draw.rect(surf, BORDER, rect, 1, border_radius=4)
-            
-            ts, tr = self.font.render(text, TEXT if enabled else TEXT_DIM)
-            surf.blit(ts, (rect.centerx - tr.width//2, rect.centery - tr.height//2))
+        for (text, rect, cb, enabled), (normal, _) in zip(self.buttons, self.faces):
+            blits.append((normal, rect.topleft))
+        blit_all(surf, blits)
+    
+    def draw_overlay(self, surf, mouse):
+        """Repaint the button under the mouse, if any, highlighted."""
+        for (text, rect, cb, enabled), (_, hover) in zip(self.buttons, self.faces):
+            if enabled and rect.collidepoint(mouse):
+                surf.blit(hover, rect.topleft)
+                return
+    
+    def _face(self, text, rect, enabled, bg):
+        # Opaque, with the corners in the bar color, so blits stay plain copies
+        face = pygame.Surface(rect.size).convert()
+        face.fill(BG_MED)
+        r = face.get_rect()
+        pygame.draw.rect(face, bg, r, border_radius=4)
+        pygame.draw.rect(face, BORDER, r, 1, border_radius=4)
+        ts, tr = self.font.render(text, TEXT if enabled else TEXT_DIM)
+        face.blit(ts, (r.centerx - tr.width//2, r.centery - tr.height//2))
+        return face
     
     def handle(self, ev) -> bool:
-        if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
+        if (ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1
+                and MENUBAR_H <= ev.pos[1] < MENUBAR_H + TOOLBAR_H):
             for text, rect, cb, enabled in self.buttons:
                 if rect.collidepoint(ev.pos) and enabled:
                     cb()
@@ -931,20 +1195,29 @@ class StatusBar:
     def __init__(self, font):
         self.font = font
         self.parts = {}
+        self._text = functools.lru_cache(maxsize=64)(font.render)
+        self._blits = []  # laid-out (surface, pos) pairs, rebuilt by set()
     
     def set(self, k, v):
-        self.parts[k] = str(v)
+        v = str(v)
+        if self.parts.get(k) == v:
+            return
+        self.parts[k] = v
+        # Parts sit side by side, so a width change moves the ones after it
+        y = WINDOW_HEIGHT - STATUSBAR_H + 5
+        x = 12
+        blits = []
+        for text in self.parts.values():
+            ts, tr = self._text(text, TEXT_DIM)
+            blits.append((ts, (x, y)))
+            x += tr.width + 20
+        self._blits = blits
     
     def draw(self, surf):
         y = WINDOW_HEIGHT - STATUSBAR_H
         pygame.draw.rect(surf, BG_MED, (0, y, WINDOW_WIDTH, STATUSBAR_H))
         pygame.draw.line(surf, BORDER, (0, y), (WINDOW_WIDTH, y))
-        
-        x = 12
-        for k, v in self.parts.items():
-            ts, tr = self.font.render(v, TEXT_DIM)
-            surf.blit(ts, (x, y + 5))
-            x += tr.width + 20
+        blit_all(surf, self._blits)
 
 
 class DebugPanel:
@@ -954,20 +1227,49 @@ class DebugPanel:
         self.visible = True
         self.tab = 0
         self.mem_off = PROGRAM_START
+        # Register values, addresses and mnemonics repeat from frame to
+        # frame, so memoize rendered (text, color) pairs
+        self._text = functools.lru_cache(maxsize=2048)(font.render)
+        # Last rendered panel, reused until _state_key() changes
+        self._panel_surf = pygame.Surface(self.rect.size).convert()
+        self._last_key = None
+        self._asm_hl = pygame.Rect(0, 0, self.rect.width - 12, 15)  # moved per line
+    
+    def _state_key(self, cpu: CPU):
+        """Everything the current tab shows, including the memory it reads."""
+        mem, pc = cpu.mem, cpu.PC
+        if self.tab == 0:
+            return (0, pc, cpu.I, bytes(cpu.V), cpu.SP, cpu.DT, cpu.ST,
+                    bytes(mem[pc:pc+2]), tuple(cpu.stack[:min(cpu.SP, 4)]))
+        if self.tab == 1:
+            n = (self.rect.height - 50) // 14 * 8
+            return (1, pc, self.mem_off, bytes(mem[self.mem_off:self.mem_off+n]))
+        lines = (self.rect.height - 50) // 15
+        start = max(PROGRAM_START, pc - (lines // 2) * 2)
+        return (2, pc, bytes(mem[start:start+lines*2]))
     
     def draw(self, surf, cpu: CPU):
         if not self.visible:
             return
+        key = self._state_key(cpu)
+        if key != self._last_key:
+            self._last_key = key
+            self._draw_panel(self._panel_surf, cpu)
+        surf.blit(self._panel_surf, self.rect.topleft)
+    
+    def _draw_panel(self, surf, cpu: CPU):
+        # Background; corners outside the rounded rect match the window
+        rect = surf.get_rect()
+        surf.fill(BG_DARK)
+        pygame.draw.rect(surf, BG_MED, rect, border_radius=6)
+        pygame.draw.rect(surf, BORDER, rect, 1, border_radius=6)
         
-        # Background
-        pygame.draw.rect(surf, BG_MED, self.rect, border_radius=6)
-        pygame.draw.rect(surf, BORDER, self.rect, 1, border_radius=6)
-        
-        x, y = self.rect.x + 10, self.rect.y + 8
+        x, y = 10, 8
+        blits = []
         
         # Title & tabs
-        ts, _ = self.font.render("DEBUG", ACCENT)
-        surf.blit(ts, (x, y))
+        ts, _ = self._text("DEBUG", ACCENT)
+        blits.append((ts, (x, y)))
         
         tabs = ["Regs", "Mem", "ASM"]
         tx = x + 70
@@ -976,9 +1278,10 @@ class DebugPanel:
             tr = pygame.Rect(tx, y - 2, tw, 18)
             if i == self.tab:
                 pygame.draw.rect(surf, BG_LIGHT, tr, border_radius=3)
-            ts, _ = self.font.render(t, TEXT if i == self.tab else TEXT_DIM)
-            surf.blit(ts, (tx + 6, y))
+            ts, _ = self._text(t, TEXT if i == self.tab else TEXT_DIM)
+            blits.append((ts, (tx + 6, y)))
             tx += tw + 4
+        blit_all(surf, blits)
         
         y += 26
         
@@ -990,11 +1293,12 @@ class DebugPanel:
             self._asm(surf, cpu, x, y)
     
     def _regs(self, surf, cpu, x, y):
+        blits = []
         # V registers
         for i in range(16):
             col = YELLOW if i == 0xF else TEXT
-            ts, _ = self.font.render(f"V{i:X}:{cpu.V[i]:02X}", col)
-            surf.blit(ts, (x + (i % 4) * 60, y + (i // 4) * 16))
+            ts, _ = self._text(f"V{i:X}:{cpu.V[i]:02X}", col)
+            blits.append((ts, (x + (i % 4) * 60, y + (i // 4) * 16)))
         y += 70
         
         # Special
@@ -1005,38 +1309,42 @@ class DebugPanel:
             ("DT", f"{cpu.DT:02X}", YELLOW),
             ("ST", f"{cpu.ST:02X}", YELLOW),
         ]):
-            ts, _ = self.font.render(f"{lbl}:{val}", col)
-            surf.blit(ts, (x + (i % 3) * 78, y + (i // 3) * 18))
+            ts, _ = self._text(f"{lbl}:{val}", col)
+            blits.append((ts, (x + (i % 3) * 78, y + (i // 3) * 18)))
         y += 45
         
         # Current opcode
         if cpu.PC < MEMORY_SIZE - 1:
             op = (cpu.mem[cpu.PC] << 8) | cpu.mem[cpu.PC + 1]
-            ts, _ = self.font.render(f"OP:{op:04X} = {cpu.disasm(cpu.PC)}", ACCENT)
-            surf.blit(ts, (x, y))
+            ts, _ = self._text(f"OP:{op:04X} = {cpu.disasm(cpu.PC)}", ACCENT)
+            blits.append((ts, (x, y)))
         y += 22
         
         # Stack
-        ts, _ = self.font.render("Stack:", TEXT_DIM)
-        surf.blit(ts, (x, y))
+        ts, _ = self._text("Stack:", TEXT_DIM)
+        blits.append((ts, (x, y)))
         y += 16
         for i in range(min(cpu.SP, 4)):
-            ts, _ = self.font.render(f"{i}:{cpu.stack[i]:04X}", TEXT)
-            surf.blit(ts, (x + i * 70, y))
+            ts, _ = self._text(f"{i}:{cpu.stack[i]:04X}", TEXT)
+            blits.append((ts, (x + i * 70, y)))
+        blit_all(surf, blits)
     
     def _mem(self, surf, cpu, x, y):
+        blits = []
         lines = (self.rect.height - 50) // 14
         for i in range(lines):
             addr = self.mem_off + i * 8
             if addr >= MEMORY_SIZE: break
             col = ACCENT if addr <= cpu.PC < addr + 8 else TEXT_DIM
-            ts, _ = self.font.render(f"{addr:04X}:", col)
-            surf.blit(ts, (x, y + i * 14))
-            hx = " ".join(f"{cpu.mem[addr+j]:02X}" for j in range(8) if addr+j < MEMORY_SIZE)
-            ts, _ = self.font.render(hx, TEXT)
-            surf.blit(ts, (x + 48, y + i * 14))
+            ts, _ = self._text(_HEX4[addr] + ":", col)
+            blits.append((ts, (x, y + i * 14)))
+            hx = " ".join([_HEX2[b] for b in cpu.mem[addr:addr+8]])
+            ts, _ = self._text(hx, TEXT)
+            blits.append((ts, (x + 48, y + i * 14)))
+        blit_all(surf, blits)
     
     def _asm(self, surf, cpu, x, y):
+        blits = []
         lines = (self.rect.height - 50) // 15
         start = max(PROGRAM_START, cpu.PC - (lines // 2) * 2)
         for i in range(lines):
@@ -1044,14 +1352,16 @@ class DebugPanel:
             if addr >= MEMORY_SIZE - 1: break
             cur = addr == cpu.PC
             if cur:
-                pygame.draw.rect(surf, BG_LIGHT, (x - 4, y + i * 15 - 1, self.rect.width - 12, 15))
-            ts, _ = self.font.render(f"{addr:04X}", GREEN if cur else TEXT_DIM)
-            surf.blit(ts, (x, y + i * 15))
+                self._asm_hl.topleft = (x - 4, y + i * 15 - 1)
+                pygame.draw.rect(surf, BG_LIGHT, self._asm_hl)
+            ts, _ = self._text(_HEX4[addr], GREEN if cur else TEXT_DIM)
+            blits.append((ts, (x, y + i * 15)))
             op = (cpu.mem[addr] << 8) | cpu.mem[addr + 1]
-            ts, _ = self.font.render(f"{op:04X}", YELLOW if cur else TEXT)
-            surf.blit(ts, (x + 45, y + i * 15))
-            ts, _ = self.font.render(cpu.disasm(addr), ACCENT if cur else TEXT)
-            surf.blit(ts, (x + 95, y + i * 15))
+            ts, _ = self._text(_HEX4[op], YELLOW if cur else TEXT)
+            blits.append((ts, (x + 45, y + i * 15)))
+            ts, _ = self._text(cpu.disasm(addr), ACCENT if cur else TEXT)
+            blits.append((ts, (x + 95, y + i * 15)))
+        blit_all(surf, blits)
     
     def handle(self, ev) -> bool:
         if not self.visible:
@@ -1103,11 +1413,41 @@ class Emulator:
         self.frames = 0
         self.last_sec = time.time()
         self.timer_acc = 0.0
+        self.cpu_acc = 0.0  # owed CPU cycles; speed is cycles per 60 Hz frame
         self.saves = {}
         self.pix_on = PIX_ON
         self.pix_off = PIX_OFF
         self.drag_hover = False
         
+        # Partial redraw: regions that change while the chrome stays put
+        self._chrome = None  # last _chrome_state(), None forces a full frame
+        self._display_rect = pygame.Rect(DISPLAY_X - 3, DISPLAY_Y - 3, DISPLAY_W + 6, DISPLAY_H + 6)
+        self._hud_rect = pygame.Rect(DISPLAY_X, DISPLAY_Y + DISPLAY_H + 6, DISPLAY_W, 64)
+        self._status_rect = pygame.Rect(0, WINDOW_HEIGHT - STATUSBAR_H, WINDOW_WIDTH, STATUSBAR_H)
+        
+        # "No ROM" veil and its two captions never change, so build them once
+        self._no_rom = pygame.Surface((DISPLAY_W, DISPLAY_H), pygame.SRCALPHA)
+        self._no_rom.fill((0, 0, 0, 180))
+        cx, cy = DISPLAY_X + DISPLAY_W//2, DISPLAY_Y + DISPLAY_H//2
+        ts, tr = self.font_lg.render("Drag & Drop ROM here", TEXT)
+        ss, sr = self.font.render("or press Ctrl+O / File > Open", TEXT_DIM)
+        self._no_rom_text = [(ts, (cx - tr.width//2, cy - 20)), (ss, (cx - sr.width//2, cy + 10))]
+        
+        # Menu bar and toolbar without hover state, rebuilt on _chrome_dirty
+        self._chrome_surf = pygame.Surface((WINDOW_WIDTH, MENUBAR_H + TOOLBAR_H)).convert()
+        self._chrome_dirty = True
+        
+        # Emulated screen as 8-bit surfaces: framebuffer bytes are palette
+        # indices (0=off, 1=on) copied in wholesale. They are colorized at
+        # native size into screen-format copies, which are scaled once per
+        # change so the per-frame blit needs no pixel format conversion.
+        self._pix_lo = pygame.Surface((CHIP8_WIDTH, CHIP8_HEIGHT), depth=8)
+        self._pix_hi = pygame.Surface((SCHIP_WIDTH, SCHIP_HEIGHT), depth=8)
+        self._rgb_lo = pygame.Surface((CHIP8_WIDTH, CHIP8_HEIGHT)).convert()
+        self._rgb_hi = pygame.Surface((SCHIP_WIDTH, SCHIP_HEIGHT)).convert()
+        self._pix_scaled = pygame.Surface((DISPLAY_W, DISPLAY_H)).convert()
+        self._set_palette()
+        
         # GUI
         self.menu = MenuSystem(self.font)
         self.menu.add("File", [
@@ -1224,6 +1564,13 @@ class Emulator:
     def _colors(self, on, off):
         self.pix_on = on
         self.pix_off = off
+        self._set_palette()
+    
+    def _set_palette(self):
+        for s in (self._pix_lo, self._pix_hi):
+            s.set_palette([self.pix_off, self.pix_on])
+        # The scaled copy holds RGB pixels, so rebuild it in the new colors
+        self.cpu.dirty = ALL_ROWS
     
     def _toggle_debug(self):
         self.debug.visible = not self.debug.visible
@@ -1262,11 +1609,24 @@ Drag & Drop ROM files to play!
 
     # Main loop
     def _events(self):
-        for ev in pygame.event.get():
+        evs = pygame.event.get()
+        # Only the newest cursor position matters; handlers read ev.pos,
+        # never ev.rel, so earlier motion events can be dropped outright
+        last_motion = None
+        for ev in reversed(evs):
+            if ev.type == pygame.MOUSEMOTION:
+                last_motion = ev
+                break
+        for ev in evs:
+            if ev.type == pygame.MOUSEMOTION and ev is not last_motion:
+                continue
             if ev.type == pygame.QUIT:
                 self.running = False
                 return
             
+            if ev.type == pygame.VIDEOEXPOSE:
+                self._chrome = None
+            
             # Message box has priority
             if self.msg_box.active:
                 self.msg_box.handle(ev)
@@ -1321,9 +1681,17 @@ Drag & Drop ROM files to play!
 
     def _update(self, dt):
         if self.paused or not self.cpu.loaded:
+            # Timers are frozen too, so don't leave a beep droning on
+            self.sound.stop()
             return
-        for _ in range(self.speed):
-            self.cpu.step()
+        # Pace the CPU by elapsed time rather than frames, but cap the
+        # catch-up after a stall so a slow frame can't snowball
+        cap = 4 * self.speed
+        self.cpu_acc += dt * self.speed * 60 / 1000
+        n = min(int(self.cpu_acc), cap)
+        self.cpu_acc = min(self.cpu_acc - n, 1.0)
+        if n:
+            self.cpu.run(n)
         self.timer_acc += dt
         while self.timer_acc >= 1000 / TIMER_HZ:
             self.cpu.tick_timers()
@@ -1333,11 +1701,48 @@ Drag & Drop ROM files to play!
         else:
             self.sound.stop()
 
+    def _chrome_state(self, mouse):
+        """Everything the menu bar, toolbar and layout depend on."""
+        if mouse[1] >= MENUBAR_H + TOOLBAR_H:
+            mouse = None  # hover below the bars changes nothing static
+        return (mouse, self.debug.visible)
+
     def _render(self):
+        # One cursor read per frame keeps hover consistent across widgets.
+        # Dropdowns and dialogs overlap everything, so they always get a
+        # full frame; otherwise only repaint the regions that can change
+        mouse = pygame.mouse.get_pos()
+        state = self._chrome_state(mouse)
+        overlay = self.menu.active >= 0 or self.file_browser.active or self.msg_box.active
+        if overlay or state != self._chrome:
+            self._chrome = None if overlay else state
+            self._render_full(mouse)
+        else:
+            self._render_dynamic()
+
+    def _render_dynamic(self):
+        dirty = [self._display_rect, self._hud_rect, self._status_rect]
+        self._render_display()
+        self.screen.fill(BG_DARK, self._hud_rect)
+        self._render_hud()
+        if self.debug.visible:
+            self.screen.fill(BG_DARK, self.debug.rect)
+            self.debug.draw(self.screen, self.cpu)
+            dirty.append(self.debug.rect)
+        self._update_status()
+        self.status.draw(self.screen)
+        pygame.display.update(dirty)
+
+    def _render_full(self, mouse):
         self.screen.fill(BG_DARK)
         
-        # Toolbar first (under menu)
-        self.toolbar.draw(self.screen)
+        # Static bars from cache, then the hovered toolbar button
+        if self._chrome_dirty:
+            self.menu.draw_static(self._chrome_surf)
+            self.toolbar.draw_static(self._chrome_surf)
+            self._chrome_dirty = False
+        self.screen.blit(self._chrome_surf, (0, 0))
+        self.toolbar.draw_overlay(self.screen, mouse)
         
         # Display
         self._render_display()
@@ -1352,8 +1757,8 @@ Drag & Drop ROM files to play!
         self._update_status()
         self.status.draw(self.screen)
         
-        # Menu bar last (on top)
-        self.menu.draw(self.screen)
+        # Menu highlights and dropdown last (on top)
+        self.menu.draw_overlay(self.screen, mouse)
         
         # Dialogs on very top
         self.file_browser.draw()
@@ -1363,39 +1768,33 @@ Drag & Drop ROM files to play!
 
     def _render_display(self):
         # Border
-        br = pygame.Rect(DISPLAY_X - 3, DISPLAY_Y - 3, DISPLAY_W + 6, DISPLAY_H + 6)
-        pygame.draw.rect(self.screen, BORDER, br, 2, border_radius=4)
-        
-        # Background
-        dr = pygame.Rect(DISPLAY_X, DISPLAY_Y, DISPLAY_W, DISPLAY_H)
-        pygame.draw.rect(self.screen, self.pix_off, dr)
-        
-        # Pixels
-        g = self.cpu.display()
-        w, h = self.cpu.size()
-        sx, sy = DISPLAY_W / w, DISPLAY_H / h
-        
-        for y in range(h):
-            for x in range(w):
-                if g[y][x]:
-                    pr = pygame.Rect(
-                        DISPLAY_X + int(x * sx),
-                        DISPLAY_Y + int(y * sy),
-                        int(sx) + 1,
-                        int(sy) + 1
-                    )
-                    pygame.draw.rect(self.screen, self.pix_on, pr)
+        pygame.draw.rect(self.screen, BORDER, self._display_rect, 2, border_radius=4)
+        
+        # Pixels: upload only the rows the CPU touched since last frame,
+        # and rescale only when something changed
+        cpu = self.cpu
+        d = cpu.dirty
+        if d:
+            pix, rgb = (self._pix_hi, self._rgb_hi) if cpu.hires else (self._pix_lo, self._rgb_lo)
+            g = cpu.display()
+            w, h = cpu.size()
+            buf = pix.get_buffer()
+            while d:
+                y = (d & -d).bit_length() - 1
+                if y >= h:
+                    break
+                buf.write(bytes(g[y*w:(y+1)*w]), y*w)
+                d &= d - 1
+            del buf  # release the surface lock before blitting
+            rgb.blit(pix, (0, 0))
+            pygame.transform.scale(rgb, (DISPLAY_W, DISPLAY_H), self._pix_scaled)
+            cpu.dirty = 0
+        self.screen.blit(self._pix_scaled, (DISPLAY_X, DISPLAY_Y))
         
         # "No ROM" overlay
         if not self.cpu.loaded:
-            overlay = pygame.Surface((DISPLAY_W, DISPLAY_H), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (DISPLAY_X, DISPLAY_Y))
-            
-            ts, tr = self.font_lg.render("Drag & Drop ROM here", TEXT)
-            self.screen.blit(ts, (DISPLAY_X + DISPLAY_W//2 - tr.width//2, DISPLAY_Y + DISPLAY_H//2 - 20))
-            ts, tr = self.font.render("or press Ctrl+O / File > Open", TEXT_DIM)
-            self.screen.blit(ts, (DISPLAY_X + DISPLAY_W//2 - tr.width//2, DISPLAY_Y + DISPLAY_H//2 + 10))
+            self.screen.blit(self._no_rom, (DISPLAY_X, DISPLAY_Y))
+            blit_all(self.screen, self._no_rom_text)
 
     def _render_hud(self):
         x = DISPLAY_X
@@ -1415,9 +1814,10 @@ Drag & Drop ROM files to play!
         self.screen.blit(ts, (x, y))
         
         # Active keys
-        pressed = [f"{k:X}" for k in range(16) if self.cpu.keys[k]]
-        if pressed:
-            ts, _ = self.font.render("Active: " + " ".join(pressed), GREEN)
+        mask = self.cpu.keys_mask
+        if mask:
+            pressed = " ".join(f"{k:X}" for k in range(16) if (mask >> k) & 1)
+            ts, _ = self.font.render("Active: " + pressed, GREEN)
             self.screen.blit(ts, (x + 300, y))
         
         y += 18